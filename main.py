@@ -1,9 +1,28 @@
 import argparse
+import codecs
+import fnmatch
+import glob
+import mmap
 import os
 import re
+import stat
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional, unsorted end times then use the plain Python merge loop
+    njit = None
+
+try:
+    from src.io_uring_reader import read_file_uring
+except ImportError:  # liburing is optional, only needed for --io-uring
+    read_file_uring = None
 
 from src.srt_block import SrtBlock
-from src.timecode import DecimalTimecode
+from src.timecode import DecimalTimecode, is_srt_timecode_line
 
 Timecode = DecimalTimecode
 
@@ -16,112 +35,323 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("srt_file", help="Path to the SRT file")
     parser.add_argument("block_length", type=int, help="Desired block length in seconds")
     parser.add_argument("output_path", nargs="?", default=None, help="Output directory (default: same directory as input file)")
+    parser.add_argument("--glob", action="store_true", help="Treat srt_file as a glob pattern and process all matching files in parallel")
+    parser.add_argument("--io-uring", action="store_true", help="Read the input file through io_uring (Linux, requires liburing)")
     return parser.parse_args()
 
 
-def read_srt(filepath: str) -> list[SrtBlock]:
+def read_srt(filepath: str, use_io_uring: bool = False) -> list[SrtBlock]:
     """Read an SRT file and return an ordered list of SrtBlocks."""
-    with open(filepath, encoding="utf-8-sig") as f:
-        content = f.read()
-
-    blocks: list[SrtBlock] = []
-    # Split on blank lines to get raw block chunks
-    raw_blocks = re.split(r'\n\s*\n', content.strip())
-
-    for raw in raw_blocks:
-        lines = raw.strip().splitlines()
-        if len(lines) < 3:
-            continue
-
-        index = int(lines[0].strip())
-
-        tc_match = TIMECODE_LINE_PATTERN.match(lines[1].strip())
+    if use_io_uring:
+        if read_file_uring is None:
+            raise ValueError("Reading with io_uring requires the 'liburing' package")
+        data = read_file_uring(filepath)
+        start = len(codecs.BOM_UTF8) if data.startswith(codecs.BOM_UTF8) else 0
+        return list(iter_blocks(_universal_lines(_buffer_lines(data, start))))
+
+    with open(filepath, "rb", buffering=1 << 20) as f:
+        st = os.fstat(f.fileno())
+        if not stat.S_ISREG(st.st_mode):
+            # pipes and other streams cannot be mapped (and report no size), so read them line by line
+            return list(iter_blocks(_universal_lines(_skip_bom(iter(f.readline, b"")))))
+        if st.st_size == 0:
+            return []
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:len(codecs.BOM_UTF8)] == codecs.BOM_UTF8:
+                mm.seek(len(codecs.BOM_UTF8))
+            return list(iter_blocks(_universal_lines(iter(mm.readline, b""))))
+
+def _buffer_lines(data: bytearray, start: int = 0) -> Iterator[bytearray]:
+    """Yield the '\n'-terminated lines of an in-memory buffer, starting at offset start."""
+    end = len(data)
+    while start < end:
+        newline = data.find(b"\n", start)
+        stop = end if newline == -1 else newline + 1
+        yield data[start:stop]
+        start = stop
+
+def _skip_bom(lines: Iterable[bytes]) -> Iterator[bytes]:
+    """Drop a UTF-8 BOM from the start of the first line."""
+    lines = iter(lines)
+    for line in lines:
+        yield line.removeprefix(codecs.BOM_UTF8)
+        break
+    yield from lines
+
+def _universal_lines(lines: Iterable[bytes]) -> Iterator[bytes]:
+    """Split '\n'-terminated lines further on lone '\r', matching text mode's universal newlines.
+
+    Files with CR-only line endings otherwise arrive as a single line.
+    """
+    for line in lines:
+        # a '\r' anywhere but in a trailing '\r\n' is a line break of its own
+        end = len(line) - 2 if line.endswith(b"\r\n") else len(line)
+        if line.find(b"\r", 0, end) != -1:
+            yield from line.splitlines(keepends=True)
+        else:
+            yield line
+
+def iter_blocks(f: Iterable[bytes]) -> Iterator[SrtBlock]:
+    """Yield SrtBlocks from an iterable of UTF-8 encoded SRT lines, one block per blank-line separated chunk.
+
+    Index and timecode lines are ASCII and parsed without decoding; only the text is decoded.
+    """
+    index_line: bytes | None = None
+    timecode_line: bytes | None = None
+    text_parts: list[bytes] = []
+    # identical subtitle texts (music cues, speaker tags, ...) share one string object
+    intern_table: dict[str, str] = {}
+
+    for line in f:
+        # a blank (or whitespace-only) line closes the current block; isspace() avoids a stripped copy per line,
+        # but only knows ASCII whitespace, so non-ASCII lines (e.g. a lone no-break space) are checked decoded
+        if line.isspace() or (not line.isascii() and line.decode("utf-8", "replace").isspace()):
+            if text_parts:
+                yield _make_block(index_line, timecode_line, text_parts, intern_table)
+            index_line, timecode_line, text_parts = None, None, []
+        elif index_line is None:
+            index_line = line  # int() ignores the surrounding whitespace
+        elif timecode_line is None:
+            timecode_line = line.strip()
+        else:
+            text_parts.append(line.rstrip(b"\r\n"))
+
+    # the last block is not necessarily followed by a blank line
+    if text_parts:
+        yield _make_block(index_line, timecode_line, text_parts, intern_table)
+    intern_table.clear()
+
+def _make_block(
+    index_line: bytes, timecode_line: bytes, text_parts: list[bytes], intern_table: dict[str, str]
+) -> SrtBlock:
+    """Build an SrtBlock from the index line, timecode line and text lines of one raw block."""
+    index = int(index_line)
+    if is_srt_timecode_line(timecode_line):
+        # fast path: standard SRT timecode lines have a fixed layout
+        begin = Timecode.from_srt_fast(timecode_line, 0)
+        end = Timecode.from_srt_fast(timecode_line, 17)
+    else:
+        timecode_line = timecode_line.decode("ascii", errors="replace")
+        tc_match = TIMECODE_LINE_PATTERN.match(timecode_line)
         if not tc_match:
-            raise ValueError(f"Invalid timecode line in block {index}: '{lines[1].strip()}'")
+            raise ValueError(f"Invalid timecode line in block {index}: '{timecode_line}'")
 
         begin = Timecode.from_string(tc_match.group(1))
         end = Timecode.from_string(tc_match.group(2))
-        
-        # text = "\n".join(lines[2:])
-        text = remove_dots(" ".join(lines[2:]))
 
-        blocks.append(SrtBlock(index=index, begin=begin, end=end, text=text))
+    # text = "\n".join(text_parts)
+    # remove '...' from the text
+    text = b" ".join(text_parts).decode("utf-8").rstrip().replace("...", "")
+    text = intern_table.setdefault(text, text)
 
-    return blocks
+    return SrtBlock(index=index, begin=begin, end=end, text=text)
 
 def remove_linebreaks(text: str) -> str:
     """Removes linebreaks from strings."""
     return text.replace("\n", " ")
 
-def remove_dots(text: str) -> str:
-    """Removes '...' from strings."""
-    return text.replace("...", "")
+WRITE_BATCH_BLOCKS = 4096
+# number of buffers handed to one os.writev call (IOV_MAX is 1024 on Linux)
+WRITEV_BATCH_BLOCKS = 1024
 
 def write_srt(blocks: list[SrtBlock], filepath: str) -> None:
     """Write a list of SrtBlocks to an SRT file."""
     os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
-    with open(filepath, "w", encoding="utf-8") as f:
-        for block in blocks:
-            f.write(f"{block.index}\n")
-            f.write(f"{block.begin.to_string()} --> {block.end.to_string()}\n")
-            f.write(f"{block.text}\n")
-            f.write("\n")
+    if not hasattr(os, "writev"):
+        # os.writev is not available on Windows
+        _write_srt_buffered(blocks, filepath)
+        return
 
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        # one encoded buffer per block, gathered into a single syscall per batch
+        fragments: list[bytes] = []
+        for block in blocks:
+            fragments.append(_format_block(block).encode("utf-8"))
+            if len(fragments) >= WRITEV_BATCH_BLOCKS:
+                _writev_all(fd, fragments)
+                fragments.clear()
+        _writev_all(fd, fragments)
+    finally:
+        os.close(fd)
+
+def _writev_all(fd: int, fragments: list[bytes]) -> None:
+    """Write all fragments to fd, finishing with plain writes if writev comes up short."""
+    if not fragments:
+        return
+    written = os.writev(fd, fragments)
+    if written < sum(len(fragment) for fragment in fragments):
+        rest = memoryview(b"".join(fragments))[written:]
+        while rest:
+            rest = rest[os.write(fd, rest):]
+
+def _write_srt_buffered(blocks: list[SrtBlock], filepath: str) -> None:
+    """Write a list of SrtBlocks to an SRT file through a buffered text file."""
+    with open(filepath, "w", encoding="utf-8", buffering=1 << 20) as f:
+        # gather the text of many blocks and hand it to the file in one write
+        parts: list[str] = []
+        for block in blocks:
+            parts.append(_format_block(block))
+            if len(parts) >= WRITE_BATCH_BLOCKS:
+                f.write("".join(parts))
+                parts.clear()
+        f.write("".join(parts))
+
+def _format_block(block: SrtBlock) -> str:
+    """Format one SrtBlock as it appears in an SRT file, including the trailing blank line."""
+    return f"{block.index}\n{block.begin.to_string()} --> {block.end.to_string()}\n{block.text}\n\n"
+
+
+def merge_bounds(begin_units, end_units, target_units: int) -> list[int]:
+    """Return the (exclusive) stop index of every merged block.
+
+    Blocks are taken in from the first one onwards until the combined block spans
+    at least target_units, so merged block k covers blocks[stops[k-1]:stops[k]].
+    """
+    stops = []
+    i = 0
+    n = len(begin_units)
+    while i < n:
+        begin = begin_units[i]
+        end = end_units[i]
+        i += 1
+
+        # take in following blocks until the combined block is long enough or none are left
+        while i < n and (end - begin) < target_units:
+            end = end_units[i]
+            i += 1
+
+        stops.append(i)
+
+    return stops
+
+# compiled version of the merge loop, used when numba is installed
+_merge_bounds_jit = njit(cache=True)(merge_bounds) if njit is not None else None
+
+def merge_bounds_sorted(begin_units, end_units, target_units: int) -> list[int]:
+    """Same as merge_bounds, for end_units sorted in ascending order.
+
+    Instead of stepping through every block, the end of each merged block is
+    found with a binary search, so the loop runs once per merged block.
+    """
+    stops = []
+    start = 0
+    n = len(begin_units)
+    while start < n:
+        # first block that makes the combined block long enough, or past the end if there is none
+        last = int(np.searchsorted(end_units, begin_units[start] + target_units, side="left"))
+        stop = min(max(last, start) + 1, n)
+        stops.append(stop)
+        start = stop
+
+    return stops
 
 def rebuild_blocks(blocks: list[SrtBlock], block_length: Timecode) -> list[SrtBlock]:
     new_blocks: list[SrtBlock] = []
+    target_units = block_length.to_units()
+
+    # struct-of-arrays view of the block times; the SrtBlocks are only needed again for the output
+    begin_units = np.fromiter((b.begin.to_units() for b in blocks), dtype=np.int64, count=len(blocks))
+    end_units = np.fromiter((b.end.to_units() for b in blocks), dtype=np.int64, count=len(blocks))
+    if np.all(end_units[1:] >= end_units[:-1]):
+        stops = merge_bounds_sorted(begin_units, end_units, target_units)
+    elif _merge_bounds_jit is not None:
+        stops = _merge_bounds_jit(begin_units, end_units, target_units)
+    else:
+        stops = merge_bounds(begin_units.tolist(), end_units.tolist(), target_units)
+
+    start = 0
+    for stop in stops:
+        # collect the text fragments and join them once, rather than growing a string per block
+        this_block = blocks[start]
+        parts = [b.text for b in blocks[start:stop]]
+        new_blocks.append(SrtBlock(
+            index=this_block.index,
+            begin=this_block.begin,
+            end=blocks[stop - 1].end,
+            text=" ".join(parts),
+        ))
+        start = stop
 
-    while len(blocks) > 0:
-        this_block = blocks.pop(0)
-        current_length = this_block.end - this_block.begin
+    return new_blocks
 
-        # go through following blocks
-        while current_length < block_length:
-            # check if there are any blocks left to pop, otherwise break out of loop
-            if len(blocks) == 0:
-                break
+# name pattern of the files written by process_one, so batch runs do not pick up earlier output
+REBLOCKED_FILE_PATTERN = "*_reblocked_*min.srt"
 
-            # get next block in list
-            next_block = blocks.pop(0)
+def output_file_for(srt_file: str, block_length_minutes: int, output_path: str | None = None) -> str:
+    """Return the path process_one writes the reblocked version of srt_file to."""
+    output_dir = output_path or os.path.dirname(os.path.abspath(srt_file))
+    source_name = os.path.splitext(os.path.basename(srt_file))[0]
+    return os.path.join(output_dir, f"{source_name}_reblocked_{block_length_minutes}min.srt")
 
-            # append information to this block
-            this_block.text += " " + next_block.text  
-            this_block.end = next_block.end
+def process_one(srt_file: str, block_length_minutes: int, output_path: str | None = None, use_io_uring: bool = False) -> str:
+    """Read, reblock and write one SRT file. Returns the path of the written file."""
+    block_length = Timecode(minutes = block_length_minutes)
 
-            # update length of block
-            current_length = this_block.end - this_block.begin
+    blocks = read_srt(srt_file, use_io_uring=use_io_uring)
+    print(f"Loaded {len(blocks)} subtitle blocks from '{srt_file}'")
 
-        new_blocks.append(this_block)
+    number_original = len(blocks) 
+    new_blocks = rebuild_blocks(blocks, block_length)
+    print(f"Reorganized {number_original} blocks into {len(new_blocks)} blocks of around {block_length_minutes} minutes.")
 
-    return new_blocks
+    # for testing only: print output to console
+    # for block in new_blocks:
+    #     print(f'from:{block.begin} to:{block.end} \n{block.text}')
+
+    # "recount" blocks, i.e. make indices consecutive again
+    for i, block in enumerate(new_blocks):
+        block.index = i
+
+    # output new_blocks to new srt file
+    output_file = output_file_for(srt_file, block_length_minutes, output_path)
+    write_srt(new_blocks, output_file)
+    print(f"Written output to '{output_file}'")
+
+    return output_file
 
 def main():
     args = parse_args()
 
-    block_length = Timecode(minutes = args.block_length)
-
     try:
-        blocks = read_srt(args.srt_file)
-        print(f"Loaded {len(blocks)} subtitle blocks from '{args.srt_file}'")
-
-        number_original = len(blocks) 
-        new_blocks = rebuild_blocks(blocks, block_length)
-        print(f"Reorganized {number_original} blocks into {len(new_blocks)} blocks of around {args.block_length} minutes.")
-
-        # for testing only: print output to console
-        # for block in new_blocks:
-        #     print(f'from:{block.begin} to:{block.end} \n{block.text}')
-
-        # "recount" blocks, i.e. make indices consecutive again
-        for i, block in enumerate(new_blocks):
-            block.index = i
-
-        # output new_blocks to new srt file
-        output_dir = args.output_path or os.path.dirname(os.path.abspath(args.srt_file))
-        source_name = os.path.splitext(os.path.basename(args.srt_file))[0]
-        output_file = os.path.join(output_dir, f"{source_name}_reblocked_{args.block_length}min.srt")
-        write_srt(new_blocks, output_file)
-        print(f"Written output to '{output_file}'")
+        if args.glob:
+            srt_files = sorted(
+                path for path in glob.glob(args.srt_file)
+                if not fnmatch.fnmatch(os.path.basename(path), REBLOCKED_FILE_PATTERN)
+            )
+            if not srt_files:
+                raise ValueError(f"No files match '{args.srt_file}'")
+
+            # two inputs with the same name would be written to the same output file at the same time
+            sources_by_output: dict[str, str] = {}
+            for srt_file in srt_files:
+                output_file = os.path.normcase(os.path.abspath(output_file_for(srt_file, args.block_length, args.output_path)))
+                if output_file in sources_by_output:
+                    raise ValueError(
+                        f"'{sources_by_output[output_file]}' and '{srt_file}' would both be written to '{output_file}'"
+                    )
+                sources_by_output[output_file] = srt_file
+
+            # files are independent, so each one is processed in its own worker process
+            failed: list[str] = []
+            with ProcessPoolExecutor() as executor:
+                futures = {
+                    executor.submit(process_one, srt_file, args.block_length, args.output_path, args.io_uring): srt_file
+                    for srt_file in srt_files
+                }
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        failed.append(futures[future])
+                        print(f"An error occurred while processing '{futures[future]}': {e}")
+
+            print(f"Reblocked {len(srt_files) - len(failed)} of {len(srt_files)} files.")
+            if failed:
+                print("Failed: " + ", ".join(f"'{srt_file}'" for srt_file in sorted(failed)))
+        else:
+            process_one(args.srt_file, args.block_length, args.output_path, args.io_uring)
 
 
     except Exception as e:
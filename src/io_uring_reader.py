@@ -0,0 +1,74 @@
+"""Whole-file reads through Linux io_uring.
+
+Requires the optional 'liburing' package; importing this module raises ImportError without it.
+"""
+
+import os
+
+from liburing import (
+    Cqe,
+    Iovec,
+    Ring,
+    io_uring_cqe_get_data64,
+    io_uring_cqe_seen,
+    io_uring_get_sqe,
+    io_uring_prep_readv,
+    io_uring_queue_exit,
+    io_uring_queue_init,
+    io_uring_sqe_set_data64,
+    io_uring_submit,
+    io_uring_wait_cqe,
+)
+
+
+def read_file_uring(path: str, block_size: int = 1 << 20, queue_depth: int = 64) -> bytearray:
+    """Read a whole file by submitting block_size reads to an io_uring, queue_depth at a time.
+
+    All reads land directly in one preallocated buffer, which is returned as is.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        buf = bytearray(size)
+        view = memoryview(buf)
+        n_chunks = -(-size // block_size)
+
+        ring = Ring()
+        cqe = Cqe()
+        io_uring_queue_init(queue_depth, ring)
+        try:
+            for first in range(0, n_chunks, queue_depth):
+                batch = range(first, min(first + queue_depth, n_chunks))
+
+                # submit all reads of this batch at once, then collect completions in any order;
+                # the iovecs are kept alive until their reads have completed
+                iovecs = []
+                for k in batch:
+                    iovec = Iovec([view[k * block_size:(k + 1) * block_size]])
+                    iovecs.append(iovec)
+                    sqe = io_uring_get_sqe(ring)
+                    io_uring_prep_readv(sqe, fd, iovec, k * block_size)
+                    io_uring_sqe_set_data64(sqe, k)
+                io_uring_submit(ring)
+
+                for _ in batch:
+                    io_uring_wait_cqe(ring, cqe)
+                    entry = cqe[0]
+                    k = io_uring_cqe_get_data64(entry)
+                    res = entry.res
+                    io_uring_cqe_seen(ring, entry)
+
+                    if res < 0:
+                        raise OSError(-res, os.strerror(-res), path)
+                    offset = k * block_size
+                    length = min(block_size, size - offset)
+                    if res < length:
+                        # short read, fetch the rest of this chunk synchronously
+                        view[offset + res:offset + length] = os.pread(fd, length - res, offset + res)
+        finally:
+            io_uring_queue_exit(ring)
+            view.release()
+    finally:
+        os.close(fd)
+
+    return buf
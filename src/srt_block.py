@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 from src.timecode import DecimalTimecode
 
-@dataclass
+@dataclass(slots=True)
 class SrtBlock:
     index: int
     begin: DecimalTimecode
@@ -9,9 +9,13 @@ and two concrete subclasses:
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import re
 
+# zero-padded field strings, so formatting a timecode is a list lookup per field
+_TWO = [f"{i:02d}" for i in range(100)]
+_THREE = [f"{i:03d}" for i in range(1000)]
+
 
 class TimecodeBase(ABC):
     """Abstract base class for timecodes.
@@ -20,6 +24,8 @@ class TimecodeBase(ABC):
     Subclasses must implement unit conversion and string parsing/formatting.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def to_units(self) -> int:
         """Convert timecode to its smallest unit (frames or milliseconds)."""
@@ -84,7 +90,7 @@ class TimecodeBase(ABC):
         return hash(self.to_units())
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FrameTimecode(TimecodeBase):
     """Represents a video timecode with hours, minutes, seconds, and frames.
 
@@ -97,6 +103,7 @@ class FrameTimecode(TimecodeBase):
     seconds: int
     frames: int
     fps: int = 25
+    _units: int = field(init=False, repr=False, compare=False)
 
     TIMECODE_PATTERN = re.compile(r'^(\d{2}):(\d{2}):(\d{2}):(\d{2})$')
 
@@ -110,6 +117,14 @@ class FrameTimecode(TimecodeBase):
         if not 0 <= self.frames < self.fps:
             raise ValueError(f"Frames must be 0-{self.fps - 1}: {self.frames}")
 
+        # timecodes are frozen, so the frame count is computed once
+        object.__setattr__(self, "_units", (
+            self.frames
+            + self.seconds * self.fps
+            + self.minutes * 60 * self.fps
+            + self.hours * 3600 * self.fps
+        ))
+
     def to_units(self) -> int:
         return self.to_frames()
 
@@ -119,12 +134,7 @@ class FrameTimecode(TimecodeBase):
 
     def to_frames(self) -> int:
         """Convert timecode to total frame count."""
-        return (
-            self.frames
-            + self.seconds * self.fps
-            + self.minutes * 60 * self.fps
-            + self.hours * 3600 * self.fps
-        )
+        return self._units
 
     @classmethod
     def from_frames(cls, total_frames: int, fps: int = 25) -> FrameTimecode:
@@ -132,12 +142,9 @@ class FrameTimecode(TimecodeBase):
         if total_frames < 0:
             raise ValueError(f"Total frames cannot be negative: {total_frames}")
 
-        frames = total_frames % fps
-        total_seconds = total_frames // fps
-        seconds = total_seconds % 60
-        total_minutes = total_seconds // 60
-        minutes = total_minutes % 60
-        hours = total_minutes // 60
+        total_seconds, frames = divmod(total_frames, fps)
+        total_minutes, seconds = divmod(total_seconds, 60)
+        hours, minutes = divmod(total_minutes, 60)
 
         return cls(hours=hours, minutes=minutes, seconds=seconds, frames=frames, fps=fps)
 
@@ -162,7 +169,9 @@ class FrameTimecode(TimecodeBase):
 
     def to_string(self) -> str:
         """Convert timecode to string format HH:MM:SS:FF."""
-        return f"{self.hours:02d}:{self.minutes:02d}:{self.seconds:02d}:{self.frames:02d}"
+        hours = _TWO[self.hours] if self.hours < 100 else str(self.hours)
+        frames = _TWO[self.frames] if self.frames < 100 else str(self.frames)
+        return f"{hours}:{_TWO[self.minutes]}:{_TWO[self.seconds]}:{frames}"
 
     def __add__(self, other: TimecodeBase) -> FrameTimecode:
         if not isinstance(other, FrameTimecode):
@@ -207,13 +216,14 @@ class FrameTimecode(TimecodeBase):
     def to_string_rounded(self) -> str:
         """Convert timecode to string format HH:MM:SS (without frames), rounded to nearest second."""
         rounded = self.round_to_seconds()
-        return f"{rounded.hours:02d}:{rounded.minutes:02d}:{rounded.seconds:02d}"
+        hours = _TWO[rounded.hours] if rounded.hours < 100 else str(rounded.hours)
+        return f"{hours}:{_TWO[rounded.minutes]}:{_TWO[rounded.seconds]}"
 
     def __repr__(self) -> str:
         return f"FrameTimecode({self.to_string()}, fps={self.fps})"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DecimalTimecode(TimecodeBase):
     """Represents an SRT subtitle timecode with hours, minutes, seconds, and milliseconds.
 
@@ -224,6 +234,7 @@ class DecimalTimecode(TimecodeBase):
     minutes: int = 0
     seconds: int = 0
     milliseconds: int = 0
+    _units: int = field(init=False, repr=False, compare=False)
 
     TIMECODE_PATTERN = re.compile(r'^(\d{2}):(\d{2}):(\d{2}),(\d{3})$')
 
@@ -237,14 +248,17 @@ class DecimalTimecode(TimecodeBase):
         if not 0 <= self.milliseconds < 1000:
             raise ValueError(f"Milliseconds must be 0-999: {self.milliseconds}")
 
-    def to_units(self) -> int:
-        """Convert timecode to total milliseconds."""
-        return (
+        # timecodes are frozen, so the millisecond count is computed once
+        object.__setattr__(self, "_units", (
             self.milliseconds
             + self.seconds * 1000
             + self.minutes * 60_000
             + self.hours * 3_600_000
-        )
+        ))
+
+    def to_units(self) -> int:
+        """Convert timecode to total milliseconds."""
+        return self._units
 
     @classmethod
     def from_units(cls, total_ms: int) -> DecimalTimecode:
@@ -252,14 +266,30 @@ class DecimalTimecode(TimecodeBase):
         if total_ms < 0:
             raise ValueError(f"Total milliseconds cannot be negative: {total_ms}")
 
-        milliseconds = total_ms % 1000
-        total_seconds = total_ms // 1000
-        seconds = total_seconds % 60
-        total_minutes = total_seconds // 60
-        minutes = total_minutes % 60
-        hours = total_minutes // 60
+        return cls._from_valid_units(total_ms)
 
-        return cls(hours=hours, minutes=minutes, seconds=seconds, milliseconds=milliseconds)
+    @classmethod
+    def _from_valid_units(cls, total_ms: int) -> DecimalTimecode:
+        """Create a timecode from a non-negative millisecond count, skipping __post_init__.
+
+        Fields split off a valid total are in range by construction, so they are not re-checked.
+        """
+        total_seconds, milliseconds = divmod(total_ms, 1000)
+        total_minutes, seconds = divmod(total_seconds, 60)
+        hours, minutes = divmod(total_minutes, 60)
+
+        return cls._from_fields(hours, minutes, seconds, milliseconds, total_ms)
+
+    @classmethod
+    def _from_fields(cls, hours: int, minutes: int, seconds: int, milliseconds: int, total_ms: int) -> DecimalTimecode:
+        """Create a frozen timecode from already valid fields and their millisecond total, skipping __post_init__."""
+        tc = object.__new__(cls)
+        object.__setattr__(tc, "hours", hours)
+        object.__setattr__(tc, "minutes", minutes)
+        object.__setattr__(tc, "seconds", seconds)
+        object.__setattr__(tc, "milliseconds", milliseconds)
+        object.__setattr__(tc, "_units", total_ms)
+        return tc
 
     @classmethod
     def from_string(cls, tc_string: str) -> DecimalTimecode:
@@ -267,6 +297,15 @@ class DecimalTimecode(TimecodeBase):
         if not tc_string or not isinstance(tc_string, str):
             raise ValueError(f"Invalid timecode string: {tc_string}")
 
+        # fast path: well-formed timecodes have a fixed width, so the fields can be sliced out directly
+        if is_srt_timecode(tc_string):
+            return cls(
+                hours=int(tc_string[0:2]),
+                minutes=int(tc_string[3:5]),
+                seconds=int(tc_string[6:8]),
+                milliseconds=int(tc_string[9:12]),
+            )
+
         tc_string = tc_string.strip()
         match = cls.TIMECODE_PATTERN.match(tc_string)
 
@@ -276,9 +315,37 @@ class DecimalTimecode(TimecodeBase):
         hours, minutes, seconds, milliseconds = map(int, match.groups())
         return cls(hours=hours, minutes=minutes, seconds=seconds, milliseconds=milliseconds)
 
+    @classmethod
+    def from_srt_fast(cls, tc_bytes: bytes, start: int = 0) -> DecimalTimecode:
+        """Parse a well-formed ASCII HH:MM:SS,mmm timecode at tc_bytes[start:] without validation.
+
+        The caller is responsible for checking the layout (see is_srt_timecode_line);
+        the digits are read at their fixed offsets and __post_init__ is skipped.
+        """
+        hours = _d2(tc_bytes, start)
+        minutes = _d2(tc_bytes, start + 3)
+        seconds = _d2(tc_bytes, start + 6)
+        milliseconds = _d3(tc_bytes, start + 9)
+        total_ms = milliseconds + seconds * 1000 + minutes * 60_000 + hours * 3_600_000
+        return cls._from_fields(hours, minutes, seconds, milliseconds, total_ms)
+
     def to_string(self) -> str:
         """Convert timecode to string format HH:MM:SS,mmm."""
-        return f"{self.hours:02d}:{self.minutes:02d}:{self.seconds:02d},{self.milliseconds:03d}"
+        hours = _TWO[self.hours] if self.hours < 100 else str(self.hours)
+        return f"{hours}:{_TWO[self.minutes]}:{_TWO[self.seconds]},{_THREE[self.milliseconds]}"
+
+    def __add__(self, other: TimecodeBase) -> DecimalTimecode:
+        if not isinstance(other, DecimalTimecode):
+            return NotImplemented
+        return DecimalTimecode._from_valid_units(self._units + other._units)
+
+    def __sub__(self, other: TimecodeBase) -> DecimalTimecode:
+        if not isinstance(other, DecimalTimecode):
+            return NotImplemented
+        total_ms = self._units - other._units
+        if total_ms < 0:
+            raise ValueError("Cannot have negative timecode result")
+        return DecimalTimecode._from_valid_units(total_ms)
 
     def round_to_seconds(self) -> DecimalTimecode:
         """Round timecode to the nearest second."""
@@ -296,9 +363,51 @@ class DecimalTimecode(TimecodeBase):
     def to_string_rounded(self) -> str:
         """Convert timecode to string format HH:MM:SS (without milliseconds), rounded to nearest second."""
         rounded = self.round_to_seconds()
-        return f"{rounded.hours:02d}:{rounded.minutes:02d}:{rounded.seconds:02d}"
+        hours = _TWO[rounded.hours] if rounded.hours < 100 else str(rounded.hours)
+        return f"{hours}:{_TWO[rounded.minutes]}:{_TWO[rounded.seconds]}"
 
     def __repr__(self) -> str:
         return f"SrtTimecode({self.to_string()})"
 
-__all__ = ["TimecodeBase", "FrameTimecode", "DecimalTimecode", "Timecode"]
+def is_srt_timecode(tc_string: str) -> bool:
+    """Check whether a string has the fixed HH:MM:SS,mmm layout of an SRT timecode, with ASCII digits in every field."""
+    return (
+        len(tc_string) == 12
+        and tc_string[2] == ":"
+        and tc_string[5] == ":"
+        and tc_string[8] == ","
+        # int() would also accept signs and whitespace, so check the digit positions explicitly
+        and tc_string.isascii()
+        and tc_string[0:2].isdigit()
+        and tc_string[3:5].isdigit()
+        and tc_string[6:8].isdigit()
+        and tc_string[9:12].isdigit()
+    )
+
+_SRT_DIGITS = b"0123456789"
+
+def is_srt_timecode_line(line: bytes) -> bool:
+    """Check whether an ASCII line is exactly 'HH:MM:SS,mmm --> HH:MM:SS,mmm' with in-range fields.
+
+    Lines that fail this check (including minutes or seconds above 59) go through the validating parser.
+    """
+    return (
+        len(line) == 29
+        and line[12:17] == b" --> "
+        and line[2] == line[5] == line[19] == line[22] == 58  # ':'
+        and line[8] == line[25] == 44  # ','
+        # with the separators in place, every other position must be a digit
+        and line.translate(None, _SRT_DIGITS) == b"::, --> ::,"
+        # minutes and seconds must be 0-59, i.e. their tens digit at most '5'
+        and line[3] <= 53 and line[6] <= 53 and line[20] <= 53 and line[23] <= 53
+    )
+
+def _d2(s: bytes, i: int) -> int:
+    """Read the two ASCII digits at s[i:i+2] as an int."""
+    return (s[i] - 48) * 10 + s[i + 1] - 48
+
+def _d3(s: bytes, i: int) -> int:
+    """Read the three ASCII digits at s[i:i+3] as an int."""
+    return (s[i] - 48) * 100 + (s[i + 1] - 48) * 10 + s[i + 2] - 48
+
+__all__ = ["TimecodeBase", "FrameTimecode", "DecimalTimecode", "Timecode", "is_srt_timecode", "is_srt_timecode_line"]
@@ -0,0 +1,40 @@
+"""Check that the block-merge implementations in main.py agree with each other."""
+
+import random
+
+import numpy as np
+import pytest
+
+import main
+
+
+def random_times(rng: random.Random, sort_ends: bool) -> tuple[list[int], list[int]]:
+    n = rng.randint(0, 60)
+    begins = sorted(rng.randint(0, 5000) for _ in range(n))
+    ends = [begin + rng.randint(0, 300) for begin in begins]
+    if sort_ends:
+        ends.sort()
+    return begins, ends
+
+
+def test_sorted_matches_scan() -> None:
+    rng = random.Random(0)
+    for _ in range(3000):
+        begins, ends = random_times(rng, sort_ends=True)
+        target = rng.randint(0, 3000)
+        expected = main.merge_bounds(begins, ends, target)
+        got = main.merge_bounds_sorted(np.array(begins, dtype=np.int64), np.array(ends, dtype=np.int64), target)
+        assert got == expected, (begins, ends, target)
+
+
+@pytest.mark.parametrize("sort_ends", [True, False])
+def test_jit_matches_scan(sort_ends: bool) -> None:
+    if main._merge_bounds_jit is None:
+        pytest.skip("numba is not installed")
+    rng = random.Random(1)
+    for _ in range(3000):
+        begins, ends = random_times(rng, sort_ends)
+        target = rng.randint(0, 3000)
+        expected = main.merge_bounds(begins, ends, target)
+        got = main._merge_bounds_jit(np.array(begins, dtype=np.int64), np.array(ends, dtype=np.int64), target)
+        assert list(got) == expected, (begins, ends, target)
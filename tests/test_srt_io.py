@@ -0,0 +1,107 @@
+"""Round-trip and parsing checks for read_srt and write_srt."""
+
+import codecs
+import os
+import threading
+
+import pytest
+
+import main
+from src.srt_block import SrtBlock
+from src.timecode import DecimalTimecode
+
+SRT_LF = (
+    b"1\n00:00:01,000 --> 00:00:02,500\nHello...\nworld\n\n"
+    b"2\n00:00:03,000 --> 00:01:04,000\nSecond\n"
+)
+EXPECTED = [
+    (1, "00:00:01,000", "00:00:02,500", "Hello world"),
+    (2, "00:00:03,000", "00:01:04,000", "Second"),
+]
+
+
+def write_bytes(tmp_path, data: bytes) -> str:
+    path = tmp_path / "input.srt"
+    path.write_bytes(data)
+    return str(path)
+
+
+def parsed(blocks: list[SrtBlock]) -> list[tuple[int, str, str, str]]:
+    return [(b.index, b.begin.to_string(), b.end.to_string(), b.text) for b in blocks]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        SRT_LF,
+        SRT_LF.replace(b"\n", b"\r\n"),
+        SRT_LF.replace(b"\n", b"\r"),
+        SRT_LF.replace(b"\n\n", b"\r\r").replace(b"world\n", b"world\r\n"),
+        codecs.BOM_UTF8 + SRT_LF,
+        codecs.BOM_UTF8 + SRT_LF.replace(b"\n", b"\r"),
+        SRT_LF.rstrip(b"\n"),
+        SRT_LF + b"\n\n",
+    ],
+    ids=["lf", "crlf", "cr", "mixed", "bom", "bom-cr", "no-final-newline", "trailing-blank-lines"],
+)
+def test_read_srt_line_endings(tmp_path, data: bytes) -> None:
+    assert parsed(main.read_srt(write_bytes(tmp_path, data))) == EXPECTED
+
+
+@pytest.mark.parametrize("separator", [b"   \n", b"\t\n", b"\xc2\xa0\n", b"\n\n\n"], ids=["spaces", "tab", "nbsp", "several"])
+def test_read_srt_whitespace_only_separators(tmp_path, separator: bytes) -> None:
+    data = SRT_LF.replace(b"world\n\n", b"world\n" + separator)
+    assert parsed(main.read_srt(write_bytes(tmp_path, data))) == EXPECTED
+
+
+def test_read_srt_lone_cr_in_last_line_without_newline(tmp_path) -> None:
+    data = b"1\n00:00:01,000 --> 00:00:02,000\na\rB"
+    assert parsed(main.read_srt(write_bytes(tmp_path, data))) == [(1, "00:00:01,000", "00:00:02,000", "a B")]
+
+
+def test_read_srt_empty_file(tmp_path) -> None:
+    assert main.read_srt(write_bytes(tmp_path, b"")) == []
+
+
+def test_read_srt_rejects_out_of_range_minutes(tmp_path) -> None:
+    data = b"1\n00:75:01,000 --> 00:76:00,000\ntext\n"
+    with pytest.raises(ValueError, match="Minutes must be 0-59"):
+        main.read_srt(write_bytes(tmp_path, data))
+
+
+def test_read_srt_rejects_malformed_timecode(tmp_path) -> None:
+    data = b"1\n00:00:01,0a0 --> 00:00:02,000\ntext\n"
+    with pytest.raises(ValueError, match="Invalid timecode line in block 1"):
+        main.read_srt(write_bytes(tmp_path, data))
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="named pipes are POSIX only")
+def test_read_srt_from_pipe(tmp_path) -> None:
+    fifo = tmp_path / "input.srt"
+    os.mkfifo(fifo)
+    writer = threading.Thread(target=fifo.write_bytes, args=(codecs.BOM_UTF8 + SRT_LF,))
+    writer.start()
+    try:
+        assert parsed(main.read_srt(str(fifo))) == EXPECTED
+    finally:
+        writer.join()
+
+
+def test_write_srt_round_trip(tmp_path) -> None:
+    blocks = [
+        SrtBlock(index=0, begin=DecimalTimecode(0, 0, 1, 0), end=DecimalTimecode(0, 2, 0, 500), text="Héllo wörld"),
+        SrtBlock(index=1, begin=DecimalTimecode(1, 2, 3, 4), end=DecimalTimecode(99, 59, 59, 999), text="Second"),
+    ]
+    path = str(tmp_path / "out" / "output.srt")
+    main.write_srt(blocks, path)
+
+    assert main.read_srt(path) == blocks
+    with open(path, "rb") as f:
+        assert f.read().startswith(b"0\n00:00:01,000 --> 00:02:00,500\nH\xc3\xa9llo w\xc3\xb6rld\n\n")
+
+
+def test_write_srt_buffered_matches_writev(tmp_path) -> None:
+    blocks = main.read_srt(write_bytes(tmp_path, SRT_LF))
+    main.write_srt(blocks, str(tmp_path / "writev.srt"))
+    main._write_srt_buffered(blocks, str(tmp_path / "buffered.srt"))
+    assert (tmp_path / "writev.srt").read_bytes() == (tmp_path / "buffered.srt").read_bytes()
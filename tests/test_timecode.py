@@ -0,0 +1,24 @@
+"""Parsing checks for DecimalTimecode."""
+
+import pytest
+
+from src.timecode import DecimalTimecode
+
+
+@pytest.mark.parametrize("tc_string", ["01:02:03,004", " 01:02:03,004 ", "01:02:03,004\n"])
+def test_from_string_accepts_srt_timecodes(tc_string: str) -> None:
+    assert DecimalTimecode.from_string(tc_string) == DecimalTimecode(1, 2, 3, 4)
+
+
+@pytest.mark.parametrize(
+    "tc_string",
+    ["+1:00:00,000", " 1:00:00,000", "01:00:00, 12", "01:00:00,+12", "0a:00:00,000", "01:00:00.000"],
+)
+def test_from_string_rejects_malformed_timecodes(tc_string: str) -> None:
+    with pytest.raises(ValueError, match="Invalid timecode format"):
+        DecimalTimecode.from_string(tc_string)
+
+
+def test_from_string_rejects_out_of_range_fields() -> None:
+    with pytest.raises(ValueError, match="Minutes must be 0-59"):
+        DecimalTimecode.from_string("00:75:01,000")